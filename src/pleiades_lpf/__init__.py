@@ -11,36 +11,186 @@ LPF is a JSON-based format for encoding information about places and their
 relationships. It is defined by https://github.com/LinkedPasts/linked-places-format
 
 This package provides functions to serialize and deserialize LPF data.
+If orjson is installed (pip install pleiades_lpf[fast]) it is used as the JSON
+backend; otherwise the standard library json module is used. dump and dumps
+only use orjson for calls whose output it can match, that is with
+ensure_ascii=False and either separators=(",", ":") or indent=2; by default
+they write exactly what json writes. On the orjson path, integers wider than
+64 bits raise TypeError, NaN and infinity are written as null (json writes
+NaN/Infinity), and very small floats are written as e.g. 1e-5 rather than
+1e-05. Very large files
+can be read one feature at a time with load_stream or iter_features, which
+require ijson (pip install pleiades_lpf[stream]).
 """
 __version__ = "0.0.1"
 __all__ = [
     "dump",
     "dumps",
+    "iter_features",
     "load",
+    "load_stream",
     "loads",
 ]
 __author__ = "Tom Elliott <tom.elliott@nyu.edu>"
 
+from collections.abc import Iterator
+import io
 import json
-from .gazetteer import FeatureCollection
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from .gazetteer import Feature, FeatureCollection
+
+# stdlib json keyword arguments that can be mapped onto orjson; any others send
+# the call to the stdlib backend (see also _orjson_dump_ok)
+ORJSON_DUMP_KWARGS = {"default", "ensure_ascii", "indent", "separators", "sort_keys"}
+
+
+def _orjson_ok(kwargs: dict, supported: set | frozenset = frozenset()) -> bool:
+    """Can this call be handled by orjson?"""
+    return orjson is not None and supported.issuperset(kwargs)
+
+
+def _orjson_dump_ok(kwargs: dict) -> bool:
+    """Would orjson write the same text as json for this dump or dumps call?"""
+    # orjson only writes unescaped UTF-8, either compact or indented by 2 spaces
+    if not _orjson_ok(kwargs, ORJSON_DUMP_KWARGS):
+        return False
+    if kwargs.get("ensure_ascii") is not False:
+        return False
+    separators = tuple(kwargs.get("separators") or ())
+    if kwargs.get("indent") is None:
+        return separators == (",", ":")
+    return kwargs["indent"] == 2 and separators in ((), (",", ": "))
+
+
+def _bytes_source(fp):
+    """Return a binary file-like object for fp, bypassing UTF-8 text decoding."""
+    encoding = getattr(fp, "encoding", None)
+    if encoding and encoding.lower().replace("-", "").replace("_", "") == "utf8":
+        # only at the start of the file: once fp has been read from, it may
+        # hold decoded text that its buffer no longer has
+        try:
+            if fp.tell() == 0:
+                return fp.buffer
+        except (AttributeError, OSError):
+            pass
+    return fp
+
+
+class _UTF8Reader:
+    """Read a text file-like object as UTF-8 bytes (ijson only reads bytes)."""
+
+    __slots__ = ("_fp",)
+
+    def __init__(self, fp):
+        self._fp = fp
+
+    def read(self, size: int = -1) -> bytes:
+        return self._fp.read(size).encode("utf-8")
+
+
+def _lpf_default(obj):
+    """Serialize LPF objects (Feature, Geometry, Citation, ...) via asdict."""
+    try:
+        asdict = obj.asdict
+    except AttributeError:
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        ) from None
+    return asdict()
+
+
+def _orjson_dumps(obj, **kwargs) -> bytes:
+    """Serialize with orjson, mapping stdlib json keyword arguments."""
+    option = orjson.OPT_NON_STR_KEYS
+    if kwargs.get("indent") is not None:
+        option |= orjson.OPT_INDENT_2
+    if kwargs.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=kwargs.get("default"), option=option)
 
 
 def dump(obj, fp, **kwargs) -> None:
-    """Serialize LPF object to a file-like object as JSON."""
-    return json.dump(obj, fp, **kwargs)
+    """
+    Serialize LPF object to a file-like object as JSON. Unless indent is
+    given, a FeatureCollection is written one Feature at a time.
+    """
+    kwargs.setdefault("default", _lpf_default)
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+    if isinstance(obj, FeatureCollection):
+        if kwargs.get("indent") is not None:
+            obj = obj.asdict()
+        else:
+            for s in obj.iterencode(lambda o: dumps(o, **kwargs)):
+                fp.write(s.encode("utf-8") if binary else s)
+            return
+    if _orjson_dump_ok(kwargs):
+        b = _orjson_dumps(obj, **kwargs)
+        fp.write(b if binary else b.decode("utf-8"))
+    elif binary:
+        fp.write(json.dumps(obj, **kwargs).encode("utf-8"))
+    else:
+        json.dump(obj, fp, **kwargs)
 
 
 def dumps(obj, **kwargs) -> str:
-    """Serialize LPF object to a JSON string."""
+    """
+    Serialize LPF object to a JSON string. LPF objects nested in other data are
+    serialized via their asdict method unless another default is given.
+    """
+    kwargs.setdefault("default", _lpf_default)
+    if _orjson_dump_ok(kwargs):
+        return _orjson_dumps(obj, **kwargs).decode("utf-8")
     return json.dumps(obj, **kwargs)
 
 
 def load(fp, **kwargs) -> FeatureCollection:
     """Deserialize LPF object from a file-like object containing JSON."""
-    j = json.load(fp, **kwargs)
+    if _orjson_ok(kwargs):
+        j = orjson.loads(_bytes_source(fp).read())
+    else:
+        j = json.load(fp, **kwargs)
     return FeatureCollection(**j)
 
 
+def iter_features(fp) -> Iterator[Feature]:
+    """
+    Yield the Features of an LPF FeatureCollection in a file-like object
+    containing JSON, one at a time, so that very large files can be processed
+    without holding the whole collection in memory. Requires ijson.
+    """
+    if ijson is None:
+        raise ImportError(
+            "streaming LPF requires ijson (pip install pleiades_lpf[stream])"
+        )
+    fp = _bytes_source(fp)
+    if isinstance(fp.read(0), str):
+        fp = _UTF8Reader(fp)
+    for f in ijson.items(fp, "features.item", use_float=True):
+        yield Feature(**f)
+
+
+def load_stream(fp) -> FeatureCollection:
+    """
+    Deserialize LPF object from a file-like object containing JSON, one feature
+    at a time, so that the raw JSON for the whole collection is never held in
+    memory. Requires ijson.
+    """
+    fc = FeatureCollection()
+    for f in iter_features(fp):
+        fc.add_feature(f)
+    return fc
+
+
 def loads(s, **kwargs) -> FeatureCollection:
-    """Deserialize LPF object from a JSON string."""
-    return json.loads(s, **kwargs)
+    """Deserialize LPF object from a JSON string or UTF-8 bytes."""
+    if kwargs:
+        return FeatureCollection(**json.loads(s, **kwargs))
+    return FeatureCollection.from_json_bytes(s)
@@ -9,12 +9,23 @@
 Getty Art and Architecture Thesaurus (AAT) matcher for FeatureType augmentation.
 """
 from collections import defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
 import json
 from langstring import LangString, MultiLangString
 from langcodes.tag_parser import parse_tag
 import logging
+import os
 from pathlib import Path
-from pprint import pformat
+import pickle
+from platformdirs import user_cache_dir
+import sys
+import tempfile
+import threading
+
+AAT_TERMS_PATH = Path(__file__).parent.parent.parent / "data/aat/aat_terms.json"
+AAT_LOOKUP_CACHE_PATH = Path(user_cache_dir("pleiades_lpf")) / "aat_lookup.pkl"
+AAT_LOOKUP_CACHE_VERSION = 3  # bump whenever the layout of the lookup tables changes
 
 
 class AATMatcher:
@@ -22,61 +33,177 @@ class AATMatcher:
     Matcher for Getty Art and Architecture Thesaurus (AAT) terms.
     """
 
+    __slots__ = ()
+
+    # lookup tables shared by all instances, loaded on first use
+    _terms: dict[str, tuple[str, ...]] | None = None
+    _term_names: dict[str, str] | None = None
+    _load_lock = threading.Lock()
+
     def __init__(self):
         # In a real implementation, this might load AAT data from a file or database
         logger = logging.getLogger(__name__)
         logger.debug("Initializing AATMatcher")
 
-        self._terms = dict()
-        self._term_names = dict()
-
     def match(
-        self, label: LangString, aliases: MultiLangString | None = None
+        self,
+        label: LangString | str,
+        aliases: MultiLangString | Iterable[str] | None = None,
     ) -> list[tuple[str, str]]:
-        if not self._terms:
-            self._load_terms()
-        candidates = [label.text.lower().strip()]
-        if aliases:
-            candidates.extend(
-                [alias.text.lower().strip() for alias in aliases.to_langstrings()]
+        return self.match_many([label], [aliases])[0]
+
+    def match_many(
+        self,
+        labels: list[LangString | str],
+        aliases_list: list[MultiLangString | Iterable[str] | None] | None = None,
+    ) -> list[list[tuple[str, str]]]:
+        """
+        Match a batch of labels, each with optional aliases, in a single call.
+        Labels may be LangStrings or label texts, and aliases may be a
+        MultiLangString or the alias texts themselves.
+        Returns one list of (term id, term name) pairs per label.
+        """
+        if aliases_list is None:
+            aliases_list = [None] * len(labels)
+        elif len(aliases_list) != len(labels):
+            raise ValueError(
+                f"AATMatcher:match_many got {len(labels)} labels but {len(aliases_list)} alias lists"
             )
-        hits = set()
-        for candidate in candidates:
-            try:
-                term_ids = self._terms[candidate]
-            except KeyError:
-                continue
-            else:
-                hits.update(term_ids)
-        hits = list(hits)
-        return [(hit, self._term_names.get(hit, "")) for hit in hits]
-
-    def _load_terms(self):
-        logger = logging.getLogger(__name__)
-        logger.debug("Loading AAT terms for matching")
-        whence = Path(__file__).parent.parent.parent / "data/aat/aat_terms.json"
-        with open(whence, "r", encoding="utf-8") as f:
-            raw_terms = json.load(f)
-        del f
-        for term_id, label_dict_list in raw_terms.items():
-            for label_dict in label_dict_list:
-                label_text = label_dict.get("text", "").strip().lower()
-                if label_text:
-                    try:
-                        self._terms[label_text]
-                    except KeyError:
-                        self._terms[label_text] = set()
-                    finally:
-                        self._terms[label_text].add(term_id)
-                    label_lang = label_dict.get("lang")
-                    if label_lang == "en":
-                        try:
-                            self._term_names[term_id]
-                        except KeyError:
-                            self._term_names[term_id] = label_text
-            try:
-                self._term_names[term_id]
-            except KeyError:
-                self._term_names[term_id] = (
-                    raw_terms[term_id][0].get("text", "").strip().lower()
+        normalize = _normalize
+        match_candidates = _match_candidates
+        results = []
+        for label, aliases in zip(labels, aliases_list):
+            candidates = [normalize(label if isinstance(label, str) else label.text)]
+            if isinstance(aliases, MultiLangString):
+                candidates.extend(
+                    [normalize(alias.text) for alias in aliases.to_langstrings()]
                 )
+            elif aliases:
+                candidates.extend([normalize(text) for text in aliases])
+            results.append(list(match_candidates(frozenset(candidates))))
+        return results
+
+    @staticmethod
+    def clear_cache():
+        """Discard memoized match results."""
+        _normalize.cache_clear()
+        _match_candidates.cache_clear()
+
+    @classmethod
+    def lookup_tables(cls) -> tuple[dict[str, tuple[str, ...]], dict[str, str]]:
+        """Return the shared AAT lookup tables, loading them on first use."""
+        if cls._terms is None:
+            with cls._load_lock:
+                if cls._terms is None:
+                    terms, term_names = load_aat_lookup()
+                    # _terms is the "loaded" flag, so assign it last
+                    AATMatcher._term_names = term_names
+                    AATMatcher._terms = terms
+        return cls._terms, cls._term_names
+
+
+@lru_cache(maxsize=16384)
+def _normalize(text: str) -> str:
+    """Normalize a label or alias for lookup."""
+    return text.lower().strip()
+
+
+@lru_cache(maxsize=4096)
+def _match_candidates(candidates: frozenset[str]) -> tuple[tuple[str, str], ...]:
+    """
+    Return (term id, term name) pairs for all AAT terms matching any of the
+    normalized candidate strings.
+    """
+    terms, term_names = AATMatcher.lookup_tables()
+    hits = set().union(*(terms[c] for c in candidates if c in terms))
+    return tuple((hit, term_names.get(hit, "")) for hit in hits)
+
+
+def load_aat_lookup() -> tuple[dict[str, tuple[str, ...]], dict[str, str]]:
+    """
+    Load the AAT lookup tables (label -> term ids, term id -> name).
+
+    AATMatcher calls this once per process and shares the result between all
+    instances. A pickled copy is kept in the user cache directory so that later
+    processes can skip parsing and indexing aat_terms.json. The cache starts
+    with a one-line signature of the JSON file (its location, size and mtime),
+    which is checked before anything is unpickled; if it does not match, or the
+    cache cannot be read or written, the tables are built from the JSON file.
+    """
+    logger = logging.getLogger(__name__)
+    terms_path = AAT_TERMS_PATH.resolve()
+    stat = terms_path.stat()
+    signature = [
+        AAT_LOOKUP_CACHE_VERSION,
+        str(terms_path),
+        stat.st_size,
+        stat.st_mtime_ns,
+    ]
+    header = (json.dumps(signature) + "\n").encode("utf-8")
+    try:
+        with open(AAT_LOOKUP_CACHE_PATH, "rb") as f:
+            if f.read(len(header)) != header:
+                raise ValueError("stale or not an AAT lookup cache")
+            terms, term_names = pickle.load(f)
+        if not (isinstance(terms, dict) and isinstance(term_names, dict)):
+            raise ValueError("malformed AAT lookup cache")
+    except Exception as err:
+        # missing, stale, truncated or otherwise unusable: rebuild it
+        logger.debug("AAT lookup cache not used: %s", err)
+    else:
+        logger.debug("Loaded AAT lookup from %s", AAT_LOOKUP_CACHE_PATH)
+        return terms, term_names
+    terms, term_names = _build_aat_lookup()
+    try:
+        AAT_LOOKUP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # write to a uniquely named file and rename it into place, so that
+        # concurrent processes never read or write a partial cache
+        f = tempfile.NamedTemporaryFile(
+            dir=AAT_LOOKUP_CACHE_PATH.parent, suffix=".tmp", delete=False
+        )
+        try:
+            with f:
+                f.write(header)
+                pickle.dump((terms, term_names), f, protocol=5)
+            os.replace(f.name, AAT_LOOKUP_CACHE_PATH)
+        except Exception:
+            os.unlink(f.name)
+            raise
+    except Exception as err:
+        logger.warning("Could not write AAT lookup cache: %s", err)
+    else:
+        logger.debug("Wrote AAT lookup cache to %s", AAT_LOOKUP_CACHE_PATH)
+    return terms, term_names
+
+
+def _build_aat_lookup() -> tuple[dict[str, tuple[str, ...]], dict[str, str]]:
+    """Build the AAT lookup tables from aat_terms.json."""
+    logger = logging.getLogger(__name__)
+    logger.debug("Loading AAT terms for matching")
+    terms = defaultdict(set)
+    term_names = dict()
+    with open(AAT_TERMS_PATH, "r", encoding="utf-8") as f:
+        raw_terms = json.load(f)
+    for term_id, label_dict_list in raw_terms.items():
+        for label_dict in label_dict_list:
+            label_text = label_dict.get("text", "").strip().lower()
+            if label_text:
+                terms[label_text].add(term_id)
+                label_lang = label_dict.get("lang")
+                if label_lang == "en" and term_id not in term_names:
+                    # first English label wins
+                    term_names[term_id] = label_text
+        if term_id not in term_names:
+            term_names[term_id] = label_dict_list[0].get("text", "").strip().lower()
+    # The tables are read-only from here on: store term id sets as tuples and
+    # intern all strings, so that each term id is a single shared object
+    # (pickle preserves that sharing in the cache). Plain dict, so that lookups
+    # for unknown labels cannot add keys.
+    terms = {
+        sys.intern(label): tuple(sys.intern(term_id) for term_id in term_ids)
+        for label, term_ids in terms.items()
+    }
+    term_names = {
+        sys.intern(term_id): sys.intern(name) for term_id, name in term_names.items()
+    }
+    return terms, term_names
@@ -9,6 +9,7 @@
 Define data model for citations in Pleiades LPF.
 """
 
+from functools import lru_cache
 from .identifiers import (
     Identifier,
     URLIdentifier,
@@ -25,7 +26,19 @@ CITATION_TYPES = {
     "cites": "http://purl.org/spar/cito/cites",
     "closeMatch": "http://www.w3.org/2008/05/skos-xl#closeMatch",
 }
-BIBLIOGRAPHIC_URL_NETLOCS = {"www.zotero.org", "search.worldcat.org"}
+BIBLIOGRAPHIC_URL_NETLOCS = frozenset({"www.zotero.org", "search.worldcat.org"})
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse_netloc(url: str) -> str:
+    """Return the network location part of a URL."""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=4096)
+def _cached_url_identifier(url: str) -> URLIdentifier:
+    """Return a URLIdentifier for a URL."""
+    return URLIdentifier(url)
 
 
 class Citation:
@@ -33,6 +46,16 @@ class Citation:
     Cites a single addressable component of a bibliographic work or other reference.
     """
 
+    __slots__ = (
+        "_id",
+        "_short_title",
+        "_formatted_citation",
+        "_access_url",
+        "_bibliographic_url",
+        "_citation_detail",
+        "_reason",
+    )
+
     def __init__(
         self,
         id: Identifier | str,
@@ -103,7 +126,6 @@ class Citation:
     @formatted_citation.setter
     def formatted_citation(self, formatted_citation: str):
         """Set the formatted citation string."""
-        formatted_citation = normalize_text(formatted_citation)
         self._formatted_citation = normalize_text(formatted_citation)
 
     @property
@@ -114,7 +136,7 @@ class Citation:
     @access_url.setter
     def access_url(self, access_url: str):
         """Set the access URL for the cited work."""
-        self._access_url = URLIdentifier(access_url)
+        self._access_url = _cached_url_identifier(access_url)
 
     @property
     def bibliographic_url(self) -> str:
@@ -124,12 +146,11 @@ class Citation:
     @bibliographic_url.setter
     def bibliographic_url(self, bibliographic_url: str):
         """Set the bibliographic URL for the cited work."""
-        parts = urlparse(bibliographic_url)
-        if parts.netloc not in BIBLIOGRAPHIC_URL_NETLOCS:
+        if _cached_urlparse_netloc(bibliographic_url) not in BIBLIOGRAPHIC_URL_NETLOCS:
             raise ValueError(
                 f"Bibliographic URL '{bibliographic_url}' must be from a recognized bibliographic service. Recognized domains are: {', '.join(BIBLIOGRAPHIC_URL_NETLOCS)}"
             )
-        self._bibliographic_url = URLIdentifier(bibliographic_url)
+        self._bibliographic_url = _cached_url_identifier(bibliographic_url)
 
     @property
     def citation_detail(self) -> str:
@@ -8,41 +8,94 @@
 """
 Define the underlying gazetteer data structure for Pleiades LPF.
 """
+from collections.abc import Iterable
+from enum import StrEnum
+from functools import cache, lru_cache
+import json
 from langstring import LangString, MultiLangString, Controller, GlobalFlag
 import logging
-from pprint import pformat
-import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import shapely
 from shapely.geometry import shape
-from slugify import slugify
+from string import ascii_letters
+import sys
 from typing import override
 
 from .aat import AATMatcher
 from .citations import Citation
 from .identifiers import Identifier, make_identifier
-from .text import normalize_text
+from .text import normalize_text, normalize_text_lower, slugify_text
+
+
+@cache
+def _configure_langstring():
+    """Set default rules for LangStrings (once per process)."""
+    for true_flag in (
+        GlobalFlag.VALID_LANG,
+        GlobalFlag.LOWERCASE_LANG,
+        GlobalFlag.DEFINED_TEXT,
+        GlobalFlag.DEFINED_LANG,
+    ):
+        Controller.set_flag(true_flag, True)
+
 
-# set default rules for LangStrings
-for true_flag in [
-    GlobalFlag.VALID_LANG,
-    GlobalFlag.LOWERCASE_LANG,
-    GlobalFlag.DEFINED_TEXT,
-    GlobalFlag.DEFINED_LANG,
-]:
-    Controller.set_flag(true_flag, True)
+_configure_langstring()
 
 
 logger = logging.getLogger(__name__)
-rx_lang_string = re.compile(r"^(?P<text>[^@]+?)(@(?P<lang>[a-zA-Z\-]+))?$")
-GEOMETRY_TYPES = {
-    "Point",
-    "MultiPoint",
-    "LineString",
-    "MultiLineString",
-    "Polygon",
-    "MultiPolygon",
-    "GeometryCollection",
+LANG_TAG_CHARS = frozenset(ascii_letters + "-")
+GEOMETRY_TYPES = frozenset(
+    {
+        "Point",
+        "MultiPoint",
+        "LineString",
+        "MultiLineString",
+        "Polygon",
+        "MultiPolygon",
+        "GeometryCollection",
+    }
+)
+# nesting depth of the coordinates of each geometry type that Geometry
+# supports (1: a single position); GeometryCollections have no coordinates
+COORDINATE_DEPTHS = {
+    "Point": 1,
+    "MultiPoint": 2,
+    "LineString": 2,
+    "MultiLineString": 3,
+    "Polygon": 3,
+    "MultiPolygon": 4,
+}
+
+
+class Certainty(StrEnum):
+    """LPF Geometry certainty levels."""
+
+    CERTAIN = "certain"
+    LESS_CERTAIN = "less-certain"
+    UNCERTAIN = "uncertain"
+
+
+CERTAINTY_LEVELS = frozenset(c.value for c in Certainty)
+
+# fclasses allowed by the LPF spec
+FCLASS_DESCRIPTIONS = {
+    "A": "Administrative entities (e.g. countries, provinces, municipalities)",
+    "H": "Water bodies (e.g. rivers, lakes, bays, seas)",
+    "L": "Regions, landscape areas (cultural, geographic, historical)",
+    "P": "Populated places (e.g. cities, towns, hamlets)",
+    "R": "Roads, routes, rail",
+    "S": "Sites (e.g. archaeological sites, buildings, complexes)",
+    "T": "Terrestrial landforms (e.g. mountains, valleys, capes)",
 }
-CERTAINTY_LEVELS = {"certain", "less-certain", "uncertain"}
+VALID_FCLASSES = frozenset(FCLASS_DESCRIPTIONS)
+
+# required Feature properties and their types, and the types of their items
+PROPERTY_TYPES = {"title": str, "ccodes": (list, tuple), "fclasses": (list, tuple)}
+PROPERTY_ITEM_TYPES = {"ccodes": str, "fclasses": str}
 
 
 class LPFValueError(ValueError):
@@ -57,11 +110,121 @@ class LPFTypeError(TypeError):
     pass
 
 
+def _converter(converters: dict, value):
+    """
+    Return the function in converters for the type of value, or None. Exact
+    types are looked up directly; subclasses are found with isinstance and
+    then remembered in converters.
+    """
+    try:
+        return converters[type(value)]
+    except KeyError:
+        pass
+    for cls, convert in list(converters.items()):
+        if isinstance(value, cls):
+            converters[type(value)] = convert
+            return convert
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _intern_lang(lang: str) -> str:
+    """
+    Validate a language tag once, returning it as LangString would store it,
+    interned so that the few distinct tags in a gazetteer are shared objects.
+    """
+    return sys.intern(LangString("-", lang).lang)
+
+
+@cache
+def _warn_ccodes_not_validated():
+    """Log, once, that Feature:properties['ccodes'] values are not validated."""
+    logger.warning("Country codes in Feature:properties['ccodes'] are not validated.")
+
+
+def _split_lang_tag(s: str) -> tuple[str, str]:
+    """
+    Split a "text@lang" string into (text, lang). If s does not end in a valid
+    language tag, return (s, "").
+    """
+    if "@" not in s:
+        return s, ""
+    text, _, lang = s.rpartition("@")
+    if text and "@" not in text and lang and LANG_TAG_CHARS.issuperset(lang):
+        return text, lang
+    return s, ""
+
+
+def _position(position: list | tuple) -> tuple:
+    """Return a GeoJSON position as a tuple of two or three floats."""
+    if isinstance(position, (str, bytes)) or not 2 <= len(position) <= 3:
+        raise ValueError(f"positions must have two or three numbers, not {position!r}")
+    if any(isinstance(c, (str, bytes)) for c in position):
+        raise TypeError(f"positions must contain numbers, not {position!r}")
+    return tuple(map(float, position))
+
+
+def _coordinate_tuples(coordinates: list | tuple, depth: int) -> tuple:
+    """
+    Return GeoJSON coordinates nested depth deep (1: a single position) as
+    nested tuples of floats, i.e., in the same form as shapely's
+    __geo_interface__.
+    """
+    if isinstance(coordinates, (str, bytes)):
+        raise TypeError(f"coordinates must be arrays, not {coordinates!r}")
+    if depth == 1:
+        return _position(coordinates)
+    return tuple([_coordinate_tuples(c, depth - 1) for c in coordinates])
+
+
+def _check_line(line: tuple):
+    """Check that a LineString has at least two positions."""
+    if len(line) < 2:
+        raise ValueError("LineStrings must have at least two positions")
+
+
+def _closed_rings(polygon: tuple) -> tuple:
+    """
+    Return the rings of a polygon, closing any that are not closed (as
+    shapely does), and check that each has at least four positions.
+    """
+    rings = []
+    for ring in polygon:
+        if ring and ring[0] != ring[-1]:
+            ring = (*ring, ring[0])
+        if len(ring) < 4:
+            raise ValueError("polygon rings must have at least four positions")
+        rings.append(ring)
+    return tuple(rings)
+
+
+def _geometry_coordinates(type: str, coordinates: list | tuple) -> tuple:
+    """
+    Return the coordinates of a geometry of the given type as nested tuples of
+    floats, checking their structure; empty coordinates give an empty geometry.
+    """
+    if isinstance(coordinates, (list, tuple)) and not coordinates:
+        return ()
+    coordinates = _coordinate_tuples(coordinates, COORDINATE_DEPTHS[type])
+    if type == "LineString":
+        _check_line(coordinates)
+    elif type == "MultiLineString":
+        for line in coordinates:
+            _check_line(line)
+    elif type == "Polygon":
+        coordinates = _closed_rings(coordinates)
+    elif type == "MultiPolygon":
+        coordinates = tuple([_closed_rings(polygon) for polygon in coordinates])
+    return coordinates
+
+
 class When:
     """
     LPF When.
     """
 
+    __slots__ = ()
+
     def __init__(self, earliest: str = "", latest: str = ""):
         pass
 
@@ -72,18 +235,35 @@ class Geometry:
     https://datatracker.ietf.org/doc/html/rfc7946#section-3.1
     """
 
+    __slots__ = ("_type", "_coordinates", "_shape", "_certainty", "_citations")
+
     def __init__(
         self,
         type: str,
-        coordinates: list = [],
+        coordinates: list | None = None,
         certainty: str | None = None,
-        when: When | dict = dict(),
-        citation: Citation | dict = dict(),
-        citations: list[Citation | dict] = [],
+        when: When | dict | None = None,
+        citation: Citation | dict | None = None,
+        citations: list[Citation | dict] | None = None,
         **kwargs,
     ):
         # GeoJSON spec
-        self._shape = shape({"type": type, "coordinates": coordinates})
+        if type not in GEOMETRY_TYPES:
+            raise LPFValueError(
+                f"Geometry:type must be one of {sorted(GEOMETRY_TYPES)}, not '{type}'"
+            )
+        if type not in COORDINATE_DEPTHS:
+            raise LPFValueError(f"Geometry:type '{type}' is not supported")
+        self._type = type
+        try:
+            self._coordinates = _geometry_coordinates(
+                type, coordinates if coordinates is not None else ()
+            )
+        except (TypeError, ValueError) as err:
+            raise LPFValueError(
+                f"Geometry:coordinates are not valid GeoJSON {type} coordinates: {err}"
+            ) from err
+        self._shape = None  # shapely geometry, built on first use
 
         # LPF extension
         self._certainty = None
@@ -92,7 +272,7 @@ class Geometry:
         if when:
             raise NotImplementedError("Geometry:when is not yet implemented")
         if kwargs:
-            logger.warning(f"ignoring unexpected kwargs: {pformat(kwargs, indent=2)}")
+            logger.warning("ignoring unexpected kwargs: %s", kwargs)
 
         # WHG extension
         self._citations = []
@@ -111,37 +291,66 @@ class Geometry:
 
     @certainty.setter
     def certainty(self, certainty: str | None):
-        if certainty not in CERTAINTY_LEVELS:
+        try:
+            self._certainty = Certainty(certainty)
+        except ValueError as err:
             raise LPFValueError(
-                f"Geometry:certainty must be one of {CERTAINTY_LEVELS}, not '{certainty}'"
-            )
-        self._certainty = certainty
+                f"Geometry:certainty must be one of {sorted(CERTAINTY_LEVELS)}, not '{certainty}'"
+            ) from err
 
     @property
     def citations(self) -> list[Citation]:
         """Get the list of citations."""
         return self._citations
 
-    def add_citation(self, citation: Citation | dict = {}, **kwargs):
+    def add_citation(self, citation: Citation | dict | None = None, **kwargs):
         """Add a single citation."""
         if not citation and kwargs:
             self._citations.append(Citation(**kwargs))
-        if isinstance(citation, Citation):
-            self._citations.append(citation)
-        elif isinstance(citation, dict):
-            self._citations.append(Citation(**citation))
         elif citation:
-            raise LPFTypeError(
-                f"Geometry:citations must be Citation objects, not {type(citation)}"
+            convert = _converter(_CITATION_CONVERTERS, citation)
+            if convert is None:
+                raise LPFTypeError(
+                    f"Geometry:citations must be Citation objects, not {type(citation)}"
+                )
+            self._citations.append(convert(citation))
+
+    @classmethod
+    def from_geojson(cls, geojson: dict) -> Geometry:
+        """Create a Geometry from a GeoJSON (or LPF) geometry dictionary."""
+        return cls(**geojson)
+
+    @classmethod
+    def _from_shape(cls, geom: shapely.Geometry) -> Geometry:
+        """Create a Geometry around an existing shapely geometry."""
+        if geom.geom_type not in COORDINATE_DEPTHS:
+            raise LPFValueError(
+                f"Geometry:type must be one of {sorted(COORDINATE_DEPTHS)}, not '{geom.geom_type}'"
             )
+        self = cls.__new__(cls)
+        self._type = geom.geom_type
+        self._coordinates = None  # read from the shape on first access
+        self._shape = geom
+        self._certainty = None
+        self._citations = []
+        return self
 
     @property
     def coordinates(self):
-        return self._shape.__geo_interface__["coordinates"]
+        if self._coordinates is None:
+            self._coordinates = self._shape.__geo_interface__["coordinates"]
+        return self._coordinates
+
+    @property
+    def shape(self):
+        """Get the shapely geometry (built on first access)."""
+        if self._shape is None:
+            self._shape = shape({"type": self._type, "coordinates": self._coordinates})
+        return self._shape
 
     @property
     def type(self):
-        return self._shape.geom_type
+        return self._type
 
     def asdict(self):
         """Return a dictionary representation of the Geometry."""
@@ -159,21 +368,36 @@ class Feature:
     https://datatracker.ietf.org/doc/html/rfc7946#section-3.2
     """
 
+    type = "Feature"  # GeoJSON fixed value
+
+    __slots__ = (
+        "_geometry",
+        "properties",
+        "id",
+        "when",
+        "names",
+        "_types",
+        "links",
+        "relations",
+        "descriptions",
+        "depictions",
+    )
+
     def __init__(
         self,
         geometry: Geometry | dict | None = None,
-        properties: dict = dict(),
+        properties: dict | None = None,
         id: str | int | None = None,
-        types: list[FeatureType | dict] = [],
+        types: list[FeatureType | dict] | None = None,
         **kwargs,  # kwargs are ignored
     ):
-
         # GeoJSON spec
-        self._type = "Feature"  # Fixed value
         self._geometry = None  # Geometry object or None
         if geometry:
             self.geometry = geometry
-        if properties:
+        if properties is None:
+            properties = dict()
+        elif properties:
             self._validate_properties(properties)
         self.properties = properties  # Dictionary of properties
         self.id = id  # Optional identifier (string or number)
@@ -181,7 +405,7 @@ class Feature:
         # LPF extensions
         self.when = dict()  # Temporal information
         self.names = []  # List of names
-        self.types = types  # List of types
+        self.types = types if types is not None else []  # List of types
         self.links = []  # List of links to other resources
         self.relations = []  # List of relations to other features
         self.descriptions = []  # List of descriptions
@@ -190,7 +414,7 @@ class Feature:
     def asdict(self):
         """Return a dictionary representation of the Feature."""
         result = {
-            "type": self._type,
+            "type": self.type,
             "properties": self.properties,
             "geometry": self.geometry.asdict() if self.geometry else None,
             # "when": self.when,
@@ -216,15 +440,19 @@ class Feature:
         return self._geometry
 
     @geometry.setter
-    def geometry(self, geometry: Geometry | dict):
-        """Set the Geometry object."""
-        if isinstance(geometry, dict):
-            self._geometry = Geometry(**geometry)
-        elif isinstance(geometry, Geometry):
-            self._geometry = geometry
+    def geometry(self, geometry: Geometry | dict | shapely.Geometry):
+        """
+        Set the Geometry object. Shapely geometries are wrapped as they are,
+        and other objects providing __geo_interface__ are converted.
+        """
+        convert = _converter(_GEOMETRY_CONVERTERS, geometry)
+        if convert is not None:
+            self._geometry = convert(geometry)
+        elif hasattr(geometry, "__geo_interface__"):
+            self._geometry = Geometry(**geometry.__geo_interface__)
         else:
             raise LPFTypeError(
-                f"Feature:geometry must be a Geometry object or a dict, not {type(geometry)}"
+                f"Feature:geometry must be a Geometry object, a shapely geometry or a dict, not {type(geometry)}"
             )
 
     @property
@@ -240,16 +468,22 @@ class Feature:
             )
         self._types = []
         for i, t in enumerate(types):
-            if isinstance(t, dict):
-                self._types.append(FeatureType(**t))
-            elif isinstance(t, FeatureType):
-                self._types.append(t)
-            else:
+            convert = _converter(_FEATURE_TYPE_CONVERTERS, t)
+            if convert is None:
                 raise LPFTypeError(
                     f"Feature:types must be a list of FeatureType objects or dicts, found {type(t)} in position {i}"
                 )
+            self._types.append(convert(t))
+
+    @classmethod
+    def _from_trusted_dict(cls, d: dict) -> Feature:
+        """Create a Feature from a dictionary without validating its properties."""
+        f = cls(**{k: v for k, v in d.items() if k != "properties"})
+        if d.get("properties") is not None:
+            f.properties = d["properties"]
+        return f
 
-    def _validate_properties(self, properties: dict = dict()):
+    def _validate_properties(self, properties: dict):
         """
         Validate a properties dictionary according to LPF specifications:
         "properties":{
@@ -265,8 +499,7 @@ class Feature:
             )
 
         # Validate required keys and their types
-        expected = {"title": str, "ccodes": list, "fclasses": list}
-        for key, expected_type in expected.items():
+        for key, expected_type in PROPERTY_TYPES.items():
             if key not in properties:
                 raise LPFValueError(
                     f"Feature:properties is missing required key: {key}"
@@ -276,33 +509,24 @@ class Feature:
                     f"Feature:properties[{key}] must be of type {expected_type}, not {type(properties[key])}"
                 )
         # Validate types of individual items in ccodes and fclasses
-        expected = {"ccodes": str, "fclasses": str}
-        for key, expected_subtype in expected.items():
+        for key, expected_subtype in PROPERTY_ITEM_TYPES.items():
             for i, item in enumerate(properties.get(key, [])):
                 if not isinstance(item, expected_subtype):
                     raise LPFTypeError(
                         f"Feature:properties[{key}] must be a list of {expected_subtype}, found {type(item)} in position {i}"
                     )
-        # Warn that actual values of ccodes are not validated
-        logger.warning(
-            "Country codes in Feature:properties['ccodes'] are not validated."
-        )
+        # Warn (once per process) that actual values of ccodes are not validated
+        _warn_ccodes_not_validated()
 
         # Validate the actual values of fclasses against those allowed by the LPF spec
-        VALID_FCLASSES = {
-            "A": "Administrative entities (e.g. countries, provinces, municipalities)",
-            "H": "Water bodies (e.g. rivers, lakes, bays, seas)",
-            "L": "Regions, landscape areas (cultural, geographic, historical)",
-            "P": "Populated places (e.g. cities, towns, hamlets)",
-            "R": "Roads, routes, rail",
-            "S": "Sites (e.g. archaeological sites, buildings, complexes)",
-            "T": "Terrestrial landforms (e.g. mountains, valleys, capes)",
-        }
-        for i, fclass in enumerate(properties.get("fclasses", [])):
-            if fclass not in VALID_FCLASSES:
-                raise LPFValueError(
-                    f"Feature:properties['fclasses'] contains invalid fclass '{fclass}' in position {i}. Valid fclasses are: {list(VALID_FCLASSES.keys())}"
-                )
+        # (one C-level subset check; only an invalid list is walked to report it)
+        fclasses = properties.get("fclasses", [])
+        if not VALID_FCLASSES.issuperset(fclasses):
+            for i, fclass in enumerate(fclasses):
+                if fclass not in VALID_FCLASSES:
+                    raise LPFValueError(
+                        f"Feature:properties['fclasses'] contains invalid fclass '{fclass}' in position {i}. Valid fclasses are: {sorted(VALID_FCLASSES)}"
+                    )
 
 
 class FeatureCollection:
@@ -313,28 +537,73 @@ class FeatureCollection:
 
     DEFAULT_LPF_CONTEXT = "https://raw.githubusercontent.com/LinkedPasts/linked-places/master/linkedplaces-context-v1.1.jsonld"
 
+    type = "FeatureCollection"  # GeoJSON fixed value
+
+    __slots__ = ("features", "context")
+
     def __init__(
         self,
         context: str = DEFAULT_LPF_CONTEXT,
-        features: list = [Feature | dict],
+        features: Iterable[Feature | dict] | None = None,
         **kwargs,
     ):  # kwargs are ignored
         # GeoJSON spec
-        self._type = "FeatureCollection"  # Fixed value
         self.features = []  # List of Feature objects
-        for f in features:
-            if isinstance(f, dict):
-                self.features.append(Feature(**f))
-            elif isinstance(f, Feature):
-                self.features.append(f)
-            else:
-                raise LPFTypeError(
-                    f"FeatureCollection:features must be a list of Feature objects or dicts, found {type(f)}"
-                )
+        if features is not None:
+            self._add_features(features)
 
         # LPF extension
         self.context = context  # LPF context URI
 
+    def _add_features(self, features: Iterable[Feature | dict], validate: bool = True):
+        """Add features, validating the properties of dicts unless told not to."""
+        # look up the converter again only when the type of feature changes
+        # (input from JSON is all dicts)
+        append = self.features.append
+        feature_type = convert = None
+        for f in features:
+            if type(f) is not feature_type:
+                feature_type = type(f)
+                convert = _converter(_FEATURE_CONVERTERS, f)
+                if convert is None:
+                    raise LPFTypeError(
+                        f"FeatureCollection:features must be a list of Feature objects or dicts, found {feature_type}"
+                    )
+            append(convert(f, validate))
+
+    def add_feature(self, feature: Feature | dict, validate: bool = True):
+        """Add a single feature."""
+        convert = _converter(_FEATURE_CONVERTERS, feature)
+        if convert is None:
+            raise LPFTypeError(
+                f"FeatureCollection:features must be a list of Feature objects or dicts, found {type(feature)}"
+            )
+        self.features.append(convert(feature, validate))
+
+    @classmethod
+    def from_trusted_dict(cls, d: dict) -> FeatureCollection:
+        """
+        Create a FeatureCollection from a dictionary of LPF data whose Feature
+        properties are known to be valid (e.g. data that has been loaded and
+        validated before), skipping their validation. Invalid properties are
+        then stored as they are. Note that the output of asdict cannot be read
+        back this way: it writes citation and Feature ids as "@id".
+        """
+        fc = cls(**{k: v for k, v in d.items() if k != "features"})
+        if d.get("features") is not None:
+            fc._add_features(d["features"], validate=False)
+        return fc
+
+    @classmethod
+    def from_json_bytes(cls, buf: bytes | str) -> FeatureCollection:
+        """
+        Create a FeatureCollection from LPF JSON, parsed with orjson if it is
+        installed.
+        """
+        if orjson is not None:
+            return cls(**orjson.loads(buf))
+        return cls(**json.loads(buf))
+
     def asdict(self):
         """Return a dictionary representation of the FeatureCollection."""
         return {
@@ -343,14 +612,111 @@ class FeatureCollection:
             "@context": self.context,
         }
 
+    def iterencode(self, encode=json.dumps):
+        """
+        Yield the JSON serialization of the FeatureCollection as a series of
+        strings, encoding one Feature at a time with encode so that the
+        dictionary representation of the whole collection is never built.
+        Key order and separators are those that encode gives the enclosing
+        object and an array.
+        """
+        placeholder = "\x00features\x00"
+        head, _, tail = encode(
+            {"type": self.type, "features": placeholder, "@context": self.context}
+        ).partition(encode(placeholder))
+        separator = encode([0, 0])[2:-2]
+        yield head + "["
+        for i, f in enumerate(self.features):
+            if i:
+                yield separator
+            yield encode(f.asdict())
+        yield "]" + tail
+
+    def build_shapes(self):
+        """
+        Build the shapely geometries of all Features in one vectorized call,
+        instead of one at a time on first access to each Geometry.shape.
+        Geometries that GEOS cannot read are skipped, and so raise an error
+        only when their shape is used.
+        """
+        pending = [
+            f.geometry
+            for f in self.features
+            if f.geometry is not None and f.geometry._shape is None
+        ]
+        if not pending:
+            return
+        encode = json.dumps if orjson is None else orjson.dumps
+        shapes = shapely.from_geojson(
+            [encode({"type": g.type, "coordinates": g.coordinates}) for g in pending],
+            on_invalid="ignore",
+        )
+        for geometry, geom in zip(pending, shapes):
+            if geom is not None:
+                geometry._shape = geom
+
     def augment(self):
-        """Augment the FeatureCollection and its Features."""
-        for feature in self.features:
-            feature.augment()
+        """
+        Augment the FeatureCollection and its Features, matching the
+        FeatureTypes of all Features against AAT in a single batch.
+        """
+        feature_types = [ft for feature in self.features for ft in feature.types]
+        if not feature_types:
+            return
+        matches = FeatureType._get_matcher().match_many(
+            [ft._label_parts()[0] for ft in feature_types],
+            [ft._alias_text_list() for ft in feature_types],
+        )
+        for ft, matched_aat_ids in zip(feature_types, matches):
+            ft._add_aat_citation(matched_aat_ids)
 
-    @property
-    def type(self):
-        return self._type
+
+def _label_from_langstring(label: LangString, lang_tag: str) -> tuple[str, str]:
+    """Return normalized (text, lang) for a LangString FeatureType label."""
+    if lang_tag:
+        if lang_tag != "und" and label.lang == "und":
+            # set the language tag if label lang is undefined
+            label.lang = lang_tag
+        elif lang_tag != label.lang:
+            raise LPFValueError(
+                "FeatureType:label_lang does not match LangString language tag"
+            )
+    return normalize_text_lower(label.text), _intern_lang(label.lang)
+
+
+def _label_from_str(label: str, lang_tag: str) -> tuple[str, str]:
+    """Return normalized (text, lang) for a string FeatureType label."""
+    if not lang_tag:
+        # handle "label@lang" format
+        label, lang_tag = _split_lang_tag(label)
+    return normalize_text_lower(label), _intern_lang(lang_tag or "und")
+
+
+def _label_from_dict(label: dict, lang_tag: str) -> tuple[str, str]:
+    """Return normalized (text, lang) for a dict ({"text": ..., "lang": ...}) label."""
+    return (
+        normalize_text_lower(label.get("text", "")),
+        _intern_lang(label.get("lang", "und")),
+    )
+
+
+def _alias_from_str(alias: str, lang: str) -> tuple[str, str]:
+    """Return (text, lang) for a string alias."""
+    text, tag = _split_lang_tag(alias)
+    if tag:
+        # handle "alias@lang" format
+        return text, tag
+    return alias, lang or "und"
+
+
+def _alias_pair(alias: str | LangString | dict, lang: str) -> tuple[str, str]:
+    """Return (text, lang) for a single alias."""
+    convert = _converter(_ALIAS_CONVERTERS, alias)
+    if convert is None:
+        raise LPFTypeError(
+            f"FeatureType:aliases must be strings or LangStrings, found {type(alias)}"
+        )
+    return convert(alias, lang)
 
 
 class FeatureType:
@@ -358,24 +724,36 @@ class FeatureType:
     LPF Feature Type.
     """
 
+    __slots__ = (
+        "_id",
+        "_label_text",
+        "_label_lang",
+        "_label",
+        "_citations",
+        "_alias_texts",
+        "_aliases",
+        "_when",
+    )
+
+    # shared AAT matcher, created on first use by augment
+    _aat_matcher = None
+
     def __init__(
         self,
         label: LangString | str | dict,
         label_lang: str = "",
-        citations: list[Citation | dict] = [],
-        aliases: list[LangString | str | dict] = [],
-        when: When | dict = dict(),
-        sourceLabels: list[LangString | str | dict] = [],  # lpf v1 (stored as aliases)
+        citations: list[Citation | dict] | None = None,
+        aliases: list[LangString | str | dict] | None = None,
+        when: When | dict | None = None,
+        # lpf v1 (stored as aliases)
+        sourceLabels: list[LangString | str | dict] | None = None,
         sourceLabel: str = "",  # whg variant (treated as an alias)
         identifier: str = "",  # lpf v1 (stored as id)
         id: str | Identifier = "",  # pleiades extension: alternative to identifier
         **kwargs,  # kwargs are ignored
     ):
         if kwargs:
-            logger.warning(f"ignoring unexpected kwargs: {pformat(kwargs, indent=2)}")
-
-        # tools for augmentation if needed
-        self._aat_matcher = AATMatcher()
+            logger.warning("ignoring unexpected kwargs: %s", kwargs)
 
         # LPF v1 "label"
         if not label and not sourceLabel:
@@ -390,12 +768,7 @@ class FeatureType:
 
         # LPF v1 "identifier"
         if not id and not identifier:
-            # generate id from label
-            generated_id = slugify(self.label.text)
-            logger.warning(
-                f"FeatureType: no id or identifier provided, generating id '{generated_id}' from label '{self.label.text}'"
-            )
-            self.id = generated_id
+            self._generate_id()
         elif not id and identifier:
             # LPF v1 identifier provided
             self.id = identifier
@@ -417,11 +790,10 @@ class FeatureType:
         self._citations = []
         if citations:
             self.citations = citations
-        else:
-            self._citations = []
 
         # LPF v1 sourceLabels (Pleiades variant aliases)
-        self._aliases = MultiLangString()
+        self._alias_texts = dict()  # lang -> list of normalized alias texts
+        self._aliases = None  # MultiLangString, built on demand
         if aliases:
             self.set_aliases(aliases)
         elif sourceLabels:
@@ -434,10 +806,83 @@ class FeatureType:
             # treat sourceLabel as an alias
             self.add_alias(sourceLabel)
 
+    @classmethod
+    def from_lpf_v1(
+        cls,
+        label: LangString | str | dict,
+        identifier: str = "",
+        sourceLabels: list[LangString | str | dict] | None = None,
+        label_lang: str = "",
+    ) -> FeatureType:
+        """Create a FeatureType from LPF v1 label, identifier and sourceLabels."""
+        return cls._create(label, label_lang, identifier, None, sourceLabels)
+
+    @classmethod
+    def from_whg(cls, sourceLabel: str, identifier: str = "") -> FeatureType:
+        """Create a FeatureType from a WHG variant sourceLabel and identifier."""
+        return cls._create(sourceLabel, "", identifier, None, None)
+
+    @classmethod
+    def from_pleiades(
+        cls,
+        label: LangString | str | dict,
+        id: str | Identifier = "",
+        label_lang: str = "",
+        citations: list[Citation | dict] | None = None,
+        aliases: list[LangString | str | dict] | None = None,
+    ) -> FeatureType:
+        """Create a FeatureType from Pleiades variant label, id, citations and aliases."""
+        return cls._create(label, label_lang, id, citations, aliases)
+
+    @classmethod
+    def _create(cls, label, label_lang, id, citations, aliases) -> FeatureType:
+        """
+        Create a FeatureType from arguments that are already known to belong to
+        one input variant, bypassing the argument sorting done by __init__.
+        """
+        if not label:
+            raise LPFValueError("FeatureType: label must be provided")
+        self = cls.__new__(cls)
+        self.set_label(label, label_lang)
+        if id:
+            self.id = id
+        else:
+            self._generate_id()
+        self._citations = []
+        if citations:
+            self.citations = citations
+        self._alias_texts = dict()
+        self._aliases = None
+        if aliases:
+            self.set_aliases(aliases)
+        return self
+
+    def _generate_id(self):
+        """Generate the id from the label."""
+        generated_id = slugify_text(self._label_text)
+        logger.warning(
+            "FeatureType: no id or identifier provided, generating id '%s' from label '%s'",
+            generated_id,
+            self._label_text,
+        )
+        self.id = generated_id
+
+    @classmethod
+    def _get_matcher(cls) -> AATMatcher:
+        """Return the AATMatcher shared by all FeatureTypes."""
+        if cls._aat_matcher is None:
+            cls._aat_matcher = AATMatcher()
+        return cls._aat_matcher
+
     def augment(self):
         """Augment the FeatureType."""
         # Example augmentation: match label against AAT terms
-        matched_aat_ids = self._aat_matcher.match(self.label, self.aliases)
+        self._add_aat_citation(
+            self._get_matcher().match(self._label_parts()[0], self._alias_text_list())
+        )
+
+    def _add_aat_citation(self, matched_aat_ids: list[tuple[str, str]]):
+        """Cite the AAT term matched by augment, if any."""
         match_len = len(matched_aat_ids)
         if match_len == 0:
             return
@@ -449,7 +894,7 @@ class FeatureType:
             matched_aat_id = ("300008347", "inhabited places")
         else:
             raise NotImplementedError(
-                f"FeatureType '{self.label.text}' matched multiple AAT term IDs: {matched_aat_ids}"
+                f"FeatureType '{self._label_parts()[0]}' matched multiple AAT term IDs: {matched_aat_ids}"
             )
         citation = Citation(
             id=f"aat:{matched_aat_id[0]}",
@@ -478,6 +923,8 @@ class FeatureType:
     @property
     def label(self) -> LangString:
         """Get the feature type label."""
+        if self._label is None:
+            self._label = LangString(self._label_text, self._label_lang)
         return self._label
 
     @label.setter
@@ -489,35 +936,25 @@ class FeatureType:
         """Set the feature type label."""
         if not label:
             return
-        if isinstance(label, LangString):
-            if lang_tag:
-                if lang_tag != "und" and label.lang == "und":
-                    # set the language tag if label lang is undefined
-                    label.lang = lang_tag
-                elif lang_tag != label.lang:
-                    raise LPFValueError(
-                        "FeatureType:label_lang does not match LangString language tag"
-                    )
-            self._label = LangString(normalize_text(label.text.lower()), label.lang)
-        elif isinstance(label, str):
-            if not lang_tag:
-                m = rx_lang_string.match(label)
-                if m:
-                    # handle "label@lang" format
-                    label = m.group("text")
-                    lang_tag = m.group("lang")
-            if lang_tag:
-                self._label = LangString(normalize_text(label.lower()), lang_tag)  # type: ignore
-            else:
-                self._label = LangString(normalize_text(label.lower()), "und")  # type: ignore
-        elif isinstance(label, dict):
-            self._label = LangString(
-                normalize_text(label.get("text", "")).lower(), label.get("lang", "und")
-            )
-        else:
+        convert = _converter(_LABEL_CONVERTERS, label)
+        if convert is None:
             raise LPFTypeError(
                 f"FeatureType:label must be a string or LangString, not {type(label)}"
             )
+        text, lang = convert(label, lang_tag)
+        if not text:
+            raise LPFValueError("FeatureType:label must not be empty")
+        self._label_text, self._label_lang = text, lang
+        self._label = None  # LangString, built on demand
+
+    def _label_parts(self) -> tuple[str, str]:
+        """
+        Return the label (text, lang), read from its LangString once that has
+        been built, since callers may have changed it.
+        """
+        if self._label is None:
+            return self._label_text, self._label_lang
+        return self._label.text, self._label.lang
 
     @property
     def citations(self) -> list[Citation]:
@@ -533,78 +970,74 @@ class FeatureType:
             )
         self._citations = []
         for idx, citation in enumerate(citations):
-            if isinstance(citation, dict):
-                self._citations.append(Citation(**citation))
-            elif isinstance(citation, Citation):
-                self._citations.append(citation)
-            else:
+            convert = _converter(_CITATION_CONVERTERS, citation)
+            if convert is None:
                 raise LPFTypeError(
                     f"FeatureType:citations must be a list of Citation objects, found {type(citation)} in position {idx}"
                 )
+            self._citations.append(convert(citation))
 
     def add_citation(self, citation: Citation | dict):
         """Add a single citation."""
-        if isinstance(citation, dict):
-            self._citations.append(Citation(**citation))
-        elif isinstance(citation, Citation):
-            self._citations.append(citation)
-        else:
+        convert = _converter(_CITATION_CONVERTERS, citation)
+        if convert is None:
             raise LPFTypeError(
                 f"FeatureType:citations must be Citation objects, not {type(citation)}"
             )
+        self._citations.append(convert(citation))
 
     @property
     def aliases(self) -> MultiLangString:
-        """Get the list of aliases."""
+        """Get the aliases as a MultiLangString."""
+        if self._aliases is None:
+            # built on first access; from then on it holds the aliases, since
+            # callers may change it
+            self._aliases = MultiLangString(
+                mls_dict={lang: set(texts) for lang, texts in self._alias_texts.items()}
+            )
         return self._aliases
 
+    def _alias_items(self) -> dict:
+        """Return the alias texts by language tag."""
+        if self._aliases is None:
+            return self._alias_texts
+        return self._aliases.mls_dict
+
+    def _alias_text_list(self) -> list[str]:
+        """Return the texts of all aliases, without building a MultiLangString."""
+        return [text for texts in self._alias_items().values() for text in texts]
+
+    def _store_alias(self, text: str, lang: str):
+        """Store normalized alias text under its language tag, skipping duplicates."""
+        text = normalize_text(text)
+        if not text:
+            raise LPFValueError("FeatureType:aliases must not be empty strings")
+        lang = _intern_lang(lang)
+        if self._aliases is not None:
+            self._aliases.add_entry(text, lang)
+            return
+        texts = self._alias_texts.setdefault(lang, [])
+        if text not in texts:
+            texts.append(text)
+
     def add_alias(self, alias: str | LangString | dict, lang: str = "und"):
         """Add a single alias."""
-        if isinstance(alias, LangString):
-            self._aliases.add_langstring(
-                LangString(normalize_text(alias.text), alias.lang)
-            )
-        elif isinstance(alias, str):
-            m = rx_lang_string.match(alias)
-            if m:
-                # handle "alias@lang" format
-                alias = m.group("text")
-                lang = m.group("lang")
-            if lang:
-                self._aliases.add_langstring(LangString(normalize_text(alias), lang))  # type: ignore
-            else:
-                self._aliases.add_langstring(LangString(normalize_text(alias), "und"))  # type: ignore
-        elif isinstance(alias, dict):
-            self._aliases.add_langstring(
-                LangString(
-                    normalize_text(alias.get("text", "")),
-                    alias.get("lang", "und"),
-                )
-            )
-        else:
-            raise LPFTypeError(
-                f"FeatureType:aliases must be strings or LangStrings, found {type(alias)}"
-            )
+        self._store_alias(*_alias_pair(alias, lang))
 
     def set_aliases(
         self, aliases: list[str | LangString | dict] | MultiLangString | dict
     ):
         """Set the list of aliases."""
 
-        self._aliases = MultiLangString()
-        if isinstance(aliases, MultiLangString):
-            for s in aliases.to_langstrings():
-                self.add_alias(s)
-        elif isinstance(aliases, dict):
-            for lang, lstrings in aliases.items():
-                for lstr in lstrings:
-                    self.add_alias(lstr, lang)
-        elif not isinstance(aliases, list):
+        alias_pairs = _converter(_ALIAS_PAIRS, aliases)
+        if alias_pairs is None:
             raise LPFTypeError(
                 f"FeatureType:aliases must be a list of strings, not {type(aliases)}"
             )
-        for alias in aliases:
-            self.add_alias(alias)
+        self._alias_texts = dict()
+        self._aliases = None
+        for text, lang in alias_pairs(aliases):
+            self._store_alias(text, lang)
 
     @property
     def when(self) -> When:
@@ -614,35 +1047,81 @@ class FeatureType:
     @when.setter
     def when(self, when: When | dict):
         """Set the When object."""
-        if isinstance(when, When):
-            self._when = when
-        elif isinstance(when, dict):
-            self._when = When(**when)
-        else:
+        convert = _converter(_WHEN_CONVERTERS, when)
+        if convert is None:
             raise LPFTypeError(
                 f"FeatureType:when must be a When object or a dict, not {type(when)}"
             )
+        self._when = convert(when)
 
     def asdict(self, mode="full") -> dict:
         """Return a dictionary representation of the FeatureType."""
-        source_labels = [
-            {"label": alias.text, "lang": alias.lang}
-            for alias in self.aliases.to_langstrings()
+        # alias dicts are built once and shared by sourceLabels and aliases
+        aliases = [
+            {"label": text, "lang": lang}
+            for lang, texts in self._alias_items().items()
+            for text in texts
         ]
-        source_labels.append({"label": self.label.text, "lang": self.label.lang})
+        label, label_lang = self._label_parts()
+        identifier = str(self.id)
         result = {
-            "identifier": str(self.id),
-            "label": self.label.text,
-            "sourceLabels": source_labels,
+            "identifier": identifier,
+            "label": label,
+            "sourceLabels": [*aliases, {"label": label, "lang": label_lang}],
             "when": None,  # implement when.asdict() when When is implemented
         }
         if mode == "full":
             result["citations"] = [citation.asdict() for citation in self.citations]
-            result["aliases"] = [
-                {"label": alias.text, "lang": alias.lang}
-                for alias in self.aliases.to_langstrings()
-            ]
+            result["aliases"] = aliases
 
         if self.id:
-            result["@id"] = str(self.id)
+            result["@id"] = identifier
         return result
+
+
+# type dispatch tables for the setters (see _converter)
+_CITATION_CONVERTERS = {
+    dict: lambda c: Citation(**c),
+    Citation: lambda c: c,
+}
+_GEOMETRY_CONVERTERS = {
+    dict: lambda g: Geometry(**g),
+    Geometry: lambda g: g,
+    shapely.Geometry: Geometry._from_shape,
+}
+_FEATURE_TYPE_CONVERTERS = {
+    dict: lambda t: FeatureType(**t),
+    FeatureType: lambda t: t,
+}
+# Feature converters also take the validate flag of FeatureCollection
+_FEATURE_CONVERTERS = {
+    dict: lambda f, validate: Feature(**f)
+    if validate
+    else Feature._from_trusted_dict(f),
+    Feature: lambda f, validate: f,
+}
+_LABEL_CONVERTERS = {
+    str: _label_from_str,
+    LangString: _label_from_langstring,
+    dict: _label_from_dict,
+}
+# alias converters return (text, lang); _ALIAS_PAIRS maps each kind of alias
+# container to an iterator of (text, lang) pairs for set_aliases
+_ALIAS_CONVERTERS = {
+    str: _alias_from_str,
+    LangString: lambda a, lang: (a.text, a.lang),
+    dict: lambda a, lang: (a.get("text", ""), a.get("lang", "und")),
+}
+_ALIAS_PAIRS = {
+    list: lambda aliases: (_alias_pair(a, "und") for a in aliases),
+    dict: lambda aliases: (
+        _alias_pair(a, lang) for lang, texts in aliases.items() for a in texts
+    ),
+    MultiLangString: lambda aliases: (
+        (text, lang) for lang, texts in aliases.mls_dict.items() for text in texts
+    ),
+}
+_WHEN_CONVERTERS = {
+    dict: lambda w: When(**w),
+    When: lambda w: w,
+}
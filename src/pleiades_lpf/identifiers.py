@@ -8,19 +8,34 @@
 """
 Define identification classes
 """
+from functools import lru_cache
 from .text import normalize_text
 import re
-from validators import url as validate_url
 
 VALID_IDENTIFIER_TYPES = {"url", "alphanumeric", "alphanumeric-delimited"}
 
+# validators.url is expensive, and only accepts values that start with a
+# scheme followed by "://", so values without one are rejected up front
+rx_url_prefix = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://")
+rx_delimited = re.compile(r"[A-Za-z0-9\-_,:\.]+")
 
+
+def _is_url(value: str) -> bool:
+    """Is value a valid URL?"""
+    if rx_url_prefix.match(value) is None:
+        return False
+    # imported here: validators is slow to import and only needed for URLs
+    from validators import url as validate_url
+
+    return bool(validate_url(value))
+
+
+# Memoized: equal values share one (read-only) Identifier instance.
+@lru_cache(maxsize=8192)
 def make_identifier(value: str, id_type: str = "") -> "Identifier":
     """
     Factory function to create an Identifier.
     """
-    delims = r"\-_,:\."
-    delimited_pattern = rf"^[A-Za-z0-9{delims}]+$"
     if id_type == "url":
         return URLIdentifier(value)
     elif id_type == "alphanumeric":
@@ -28,9 +43,9 @@ def make_identifier(value: str, id_type: str = "") -> "Identifier":
     elif id_type == "alphanumeric-delimited":
         return Identifier(id_type, value)
     elif id_type == "":
-        if validate_url(value):
+        if _is_url(value):
             return URLIdentifier(value)
-        elif bool(re.match(delimited_pattern, value)):
+        elif rx_delimited.fullmatch(value):
             return Identifier("alphanumeric-delimited", value)
         else:
             return Identifier("alphanumeric", value)
@@ -45,45 +60,54 @@ class Identifier:
     An identifier is a string value with a particular type.
     """
 
+    # validated once by __init__ and read-only after that, since make_identifier
+    # shares instances between callers
+    __slots__ = ("id_type", "id_value")
+
     def __init__(self, id_type: str, value: str):
-        self._type = ""
-        self._value = ""
-        self.id_type = id_type
-        self.id_value = value
-
-    @property
-    def id_type(self) -> str:
-        """Get the identifier type."""
-        return self._type
-
-    @id_type.setter
-    def id_type(self, id_type: str):
-        """Set the identifier type."""
+        object.__setattr__(self, "id_type", self._validate_type(id_type))
+        object.__setattr__(self, "id_value", self._validate_value(value))
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"Identifier:{name} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Identifier:{name} is read-only")
+
+    def __reduce__(self):
+        # copy and pickle through the factory, since attributes cannot be set
+        return make_identifier, (self.id_value, self.id_type)
+
+    @staticmethod
+    def _validate_type(id_type: str) -> str:
+        """Return the normalized identifier type, or raise if it is not valid."""
         id_type = normalize_text(id_type)
         if id_type not in VALID_IDENTIFIER_TYPES:
             raise ValueError(
                 f"Invalid identifier type: '{id_type}'. Expected one of {VALID_IDENTIFIER_TYPES}."
             )
-        self._type = id_type
-
-    @property
-    def id_value(self) -> str:
-        """Get the identifier value."""
-        return self._value
+        return id_type
 
-    @id_value.setter
-    def id_value(self, value: str):
-        """Set the identifier value."""
+    def _validate_value(self, value: str) -> str:
+        """Return the normalized identifier value, or raise if it is not valid."""
         if not isinstance(value, str):
             raise TypeError(f"Identifier value must be a string. Got '{type(value)}'")
         value = value.strip()
-        if self._type == "alphanumeric" and not value.isalnum():
+        if self.id_type == "alphanumeric" and not value.isalnum():
             raise ValueError(
                 f"Alphanumeric identifier value '{value}' must contain only letters and numbers."
             )
-        elif self._type == "url" and not validate_url(value):
+        elif self.id_type == "url" and not _is_url(value):
             raise ValueError(f"URL identifier value '{value}' must be a valid URL.")
-        self._value = normalize_text(value)
+        return normalize_text(value)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Identifier):
+            return NotImplemented
+        return self.id_type == other.id_type and self.id_value == other.id_value
+
+    def __hash__(self) -> int:
+        return hash((self.id_type, self.id_value))
 
     def __str__(self) -> str:
         return self.id_value
@@ -94,5 +118,7 @@ class URLIdentifier(Identifier):
     An identifier that is a URL.
     """
 
+    __slots__ = ()
+
     def __init__(self, url: str):
         Identifier.__init__(self, id_type="url", value=url)
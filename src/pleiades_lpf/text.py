@@ -9,11 +9,35 @@
 Text handling utilities for Pleiades LPF."""
 
 
-from textnorm import normalize_space, normalize_unicode
+from functools import lru_cache
+from slugify import slugify
+import unicodedata
 
 
+@lru_cache(maxsize=1 << 16)
 def normalize_text(text: str) -> str:
     """Normalize text by applying Unicode normalization and whitespace normalization."""
-    text = normalize_unicode(text)
-    text = normalize_space(text)
-    return text
+    if not text:
+        return text
+    if text.isascii():
+        # ASCII text is already NFC
+        return " ".join(text.split())
+    # Same result as textnorm's normalize_unicode + normalize_space, without
+    # their per-call logging overhead: NFC, then collapse whitespace and trim
+    # using C-level str methods
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def normalize_text_lower(text: str) -> str:
+    """Normalize text as normalize_text does, and lowercase it, in one pass."""
+    # str.lower rather than str.casefold: the AAT lookup tables are keyed on
+    # lowercased labels, and casefolding (e.g. "ß" -> "ss") would miss them
+    if text.isascii():
+        return " ".join(text.lower().split())
+    return " ".join(unicodedata.normalize("NFC", text).lower().split())
+
+
+@lru_cache(maxsize=4096)
+def slugify_text(text: str) -> str:
+    """Return a slug for text."""
+    return slugify(text)
@@ -0,0 +1,52 @@
+#
+# This file is part of pleiades_lpf
+# by Tom Elliott for the Institute for the Study of the Ancient World
+# (c) Copyright 2025 by New York University
+# Licensed under the AGPL-3.0; see LICENSE.txt file.
+#
+
+"""
+Shared test fixtures.
+"""
+from langstring import LangString
+from pathlib import Path
+from pleiades_lpf import aat, loads
+import pytest
+
+test_data_dir = Path(__file__).parent / "data"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def aat_lookup_cache(tmp_path_factory):
+    """Keep the AAT lookup cache out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            aat,
+            "AAT_LOOKUP_CACHE_PATH",
+            tmp_path_factory.mktemp("cache") / "aat_lookup.pkl",
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def raw_lpf_bytes():
+    """Raw bytes of the sample WHG LPF file, read once per session."""
+    return (test_data_dir / "whg_7637009.json").read_bytes()
+
+
+@pytest.fixture
+def lpf_fc(raw_lpf_bytes):
+    """A fresh FeatureCollection parsed from the sample file, safe to mutate."""
+    return loads(raw_lpf_bytes)
+
+
+@pytest.fixture(scope="session")
+def sample_langstring():
+    """A LangString alias, built once per session; tests must not modify it."""
+    return LangString("asentamiento", "es")
+
+
+@pytest.fixture(scope="session")
+def settlement_langstring():
+    """A LangString label that matches AAT, built once per session."""
+    return LangString("settlement", "en")
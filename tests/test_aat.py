@@ -0,0 +1,139 @@
+#
+# This file is part of pleiades_lpf
+# by Tom Elliott for the Institute for the Study of the Ancient World
+# (c) Copyright 2025 by New York University
+# Licensed under the AGPL-3.0; see LICENSE.txt file.
+#
+
+"""
+Test the aat module.
+"""
+
+import json
+from langstring import LangString, MultiLangString
+from pleiades_lpf import aat
+from pleiades_lpf.aat import AATMatcher, load_aat_lookup
+import pickle
+from pytest import fixture
+
+
+class TestAATMatcher:
+    def test_match(self, settlement_langstring):
+        """Test matching a label against AAT terms."""
+        matcher = AATMatcher()
+        hits = matcher.match(settlement_langstring)
+        assert ("300008347", "inhabited places") in hits
+
+    def test_match_aliases(self):
+        """Test that aliases are matched along with the label."""
+        matcher = AATMatcher()
+        hits = matcher.match(
+            LangString("no such term", "en"),
+            MultiLangString({"en": {" Settlement "}}),
+        )
+        assert ("300008347", "inhabited places") in hits
+        hits = matcher.match(LangString("no such term", "en"), [" Settlement "])
+        assert ("300008347", "inhabited places") in hits
+
+    def test_match_none(self):
+        """Test that an unmatched label returns no hits."""
+        matcher = AATMatcher()
+        assert matcher.match(LangString("no such term", "en")) == []
+
+    def test_match_many(self, settlement_langstring):
+        """Test matching a batch of labels in one call."""
+        matcher = AATMatcher()
+        labels = [settlement_langstring, LangString("no such term", "en")]
+        results = matcher.match_many(labels, [None, None])
+        assert len(results) == 2
+        assert sorted(results[0]) == sorted(matcher.match(labels[0]))
+        assert results[1] == []
+
+    def test_clear_cache(self, settlement_langstring):
+        """Test that cached results are discarded and recomputed."""
+        matcher = AATMatcher()
+        first = matcher.match(settlement_langstring)
+        AATMatcher.clear_cache()
+        assert sorted(matcher.match(settlement_langstring)) == sorted(first)
+
+
+class TestAATLookupCache:
+    @fixture
+    def terms_path(self, tmp_path, monkeypatch):
+        """A small aat_terms.json, with the lookup cache next to it."""
+        path = tmp_path / "aat_terms.json"
+        path.write_text(
+            json.dumps({"300008347": [{"text": "Settlement", "lang": "en"}]}),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(aat, "AAT_TERMS_PATH", path)
+        monkeypatch.setattr(aat, "AAT_LOOKUP_CACHE_PATH", tmp_path / "aat.pkl")
+        return path
+
+    def test_cache_hit(self, terms_path, monkeypatch):
+        """Test that a current cache is used instead of rebuilding."""
+        expected = load_aat_lookup()
+        assert aat.AAT_LOOKUP_CACHE_PATH.exists()
+        assert list(aat.AAT_LOOKUP_CACHE_PATH.parent.glob("*.tmp")) == []
+
+        def fail():
+            raise AssertionError("lookup rebuilt")
+
+        monkeypatch.setattr(aat, "_build_aat_lookup", fail)
+        assert load_aat_lookup() == expected
+
+    def test_cache_stale(self, terms_path):
+        """Test that the cache is rebuilt when the terms file changes."""
+        load_aat_lookup()
+        terms_path.write_text(
+            json.dumps({"300008389": [{"text": "Town", "lang": "en"}]}),
+            encoding="utf-8",
+        )
+        terms, term_names = load_aat_lookup()
+        assert terms == {"town": ("300008389",)}
+        with open(aat.AAT_LOOKUP_CACHE_PATH, "rb") as f:
+            assert json.loads(f.readline())[0] == aat.AAT_LOOKUP_CACHE_VERSION
+            assert pickle.load(f)[0] == terms
+
+    def test_cache_corrupt(self, terms_path):
+        """Test that unreadable or malformed cache files are rebuilt."""
+        load_aat_lookup()
+        with open(aat.AAT_LOOKUP_CACHE_PATH, "rb") as f:
+            header = f.readline()
+        for content in (
+            b"not a pickle",
+            pickle.dumps(42),
+            header + b"not a pickle",
+            header + pickle.dumps((1, 2)),
+        ):
+            aat.AAT_LOOKUP_CACHE_PATH.write_bytes(content)
+            terms, term_names = load_aat_lookup()
+            assert terms == {"settlement": ("300008347",)}
+            assert term_names == {"300008347": "settlement"}
+
+    def test_cache_stale_not_unpickled(self, terms_path, monkeypatch):
+        """Test that a cache whose signature does not match is never unpickled."""
+        load_aat_lookup()
+        terms_path.write_text(
+            json.dumps({"300008389": [{"text": "Town", "lang": "en"}]}),
+            encoding="utf-8",
+        )
+
+        def fail(f):
+            raise AssertionError("stale cache unpickled")
+
+        monkeypatch.setattr(aat.pickle, "load", fail)
+        terms, term_names = load_aat_lookup()
+        assert terms == {"town": ("300008389",)}
+
+    def test_cache_write_error(self, terms_path, monkeypatch):
+        """Test that failing to write the cache falls back to the JSON tables."""
+
+        def fail(obj, f, protocol):
+            raise pickle.PicklingError("cannot pickle")
+
+        monkeypatch.setattr(aat.pickle, "dump", fail)
+        terms, term_names = load_aat_lookup()
+        assert terms == {"settlement": ("300008347",)}
+        assert not aat.AAT_LOOKUP_CACHE_PATH.exists()
+        assert list(aat.AAT_LOOKUP_CACHE_PATH.parent.glob("*.tmp")) == []
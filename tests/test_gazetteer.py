@@ -9,8 +9,10 @@
 Test the gazetteer module.
 """
 
+import json
 from langstring import LangString, MultiLangString
 from pleiades_lpf.gazetteer import (
+    Certainty,
     Feature,
     FeatureCollection,
     FeatureType,
@@ -18,61 +20,57 @@ from pleiades_lpf.gazetteer import (
     LPFTypeError,
     LPFValueError,
 )
-from pytest import raises
+from pytest import mark, raises
+import shapely
+
+# shared by tests that do not modify the properties
+VALID_PROPS = {"title": "Test Place", "ccodes": ("US",), "fclasses": ("P",)}
 
 
 class TestFeature:
-    def test_valid_properties(self):
-        """Test that valid properties pass validation."""
-        props = {"title": "Test Place", "ccodes": ["US"], "fclasses": ["P"]}
-        feature = Feature(properties=props)
-        assert feature.properties == props
-
-    def test_invalid_properties_not_dict(self):
-        """Test that non-dictionary properties raise an error."""
-        with raises(LPFTypeError):
-            Feature(properties="not a dict")  # type: ignore
-
-    def test_missing_required_key(self):
-        """Test that missing required keys raise an error."""
-        props = {
-            "title": "Test Place",
-            "ccodes": ["US"],
-            # Missing 'fclasses'
-        }
-        with raises(LPFValueError):
-            Feature(properties=props)
-
-    def test_invalid_key_type(self):
-        """Test that invalid key types raise an error."""
-        props = {
-            "title": "Test Place",
-            "ccodes": "US",  # Should be a list
-            "fclasses": ["P"],
-        }
-        with raises(LPFTypeError):
-            Feature(properties=props)
-
-    def test_invalid_list_item_type(self):
-        """Test that invalid list item types raise an error."""
-        props = {
-            "title": "Test Place",
-            "ccodes": ["US"],
-            "fclasses": [123],  # Should be strings
-        }
-        with raises(LPFTypeError):
-            Feature(properties=props)
+    @mark.parametrize(
+        "props,exc",
+        [
+            ({"title": "Test Place", "ccodes": ["US"], "fclasses": ["P"]}, None),
+            (VALID_PROPS, None),
+            ("not a dict", LPFTypeError),
+            # missing 'fclasses'
+            ({"title": "Test Place", "ccodes": ["US"]}, LPFValueError),
+            # 'ccodes' should be a list
+            ({"title": "Test Place", "ccodes": "US", "fclasses": ["P"]}, LPFTypeError),
+            # 'fclasses' items should be strings
+            (
+                {"title": "Test Place", "ccodes": ["US"], "fclasses": [123]},
+                LPFTypeError,
+            ),
+        ],
+        ids=[
+            "valid",
+            "valid_tuples",
+            "not_dict",
+            "missing_key",
+            "key_type",
+            "list_item_type",
+        ],
+    )
+    def test_properties_validation(self, props, exc):
+        """Test that valid properties pass validation and invalid ones raise errors."""
+        if exc:
+            with raises(exc):
+                Feature(properties=props)
+        else:
+            assert Feature(properties=props).properties == props
 
     def test_feature_geometry(self):
         """Test that geometry can be assigned and retrieved."""
-        props = {"title": "Test Place", "ccodes": ["US"], "fclasses": ["P"]}
+        props = VALID_PROPS
         geom = Geometry(type="Point", coordinates=[102.0, 0.5])
         feature = Feature(properties=props, geometry=geom)
         assert feature.geometry == geom
 
     def test_feature_geometry_dict(self):
         """Test that geometry can be assigned as a dict."""
-        props = {"title": "Test Place", "ccodes": ["US"], "fclasses": ["P"]}
+        props = VALID_PROPS
         geom_dict = {"type": "Point", "coordinates": [102.0, 0.5]}
         feature = Feature(properties=props, geometry=geom_dict)
         assert isinstance(feature.geometry, Geometry)
@@ -94,9 +92,92 @@ class TestFeatureCollection:
         assert fc.features[0].properties["title"] == "Place 1"
         assert fc.features[1].properties["title"] == "Place 2"
 
+    def test_feature_collection_mixed_features(self):
+        """Test creating a FeatureCollection from Features and dicts."""
+        props = {"title": "Place 1", "ccodes": ["US"], "fclasses": ["P"]}
+        fc = FeatureCollection(
+            features=[Feature(properties=props), {"properties": props}]
+        )
+        assert [f.properties["title"] for f in fc.features] == ["Place 1", "Place 1"]
+        fc = FeatureCollection(features=({"properties": props} for _ in range(3)))
+        assert len(fc.features) == 3
+        fc = FeatureCollection(features=iter([{"properties": props}, fc.features[0]]))
+        assert fc.features[1].properties["title"] == "Place 1"
+        with raises(LPFTypeError):
+            FeatureCollection(features=["Place 1", "Place 2"])
+        with raises(LPFTypeError):
+            FeatureCollection(features=[{"properties": props}, "Place 2"])
+
+    def test_default_arguments(self):
+        """Test that omitted arguments give fresh, empty values."""
+        fc = FeatureCollection()
+        assert fc.features == []
+        assert fc.type == FeatureCollection.type == "FeatureCollection"
+        assert Feature().type == "Feature"
+        f1, f2 = Feature(), Feature()
+        f1.properties["title"] = "Place 1"
+        assert f2.properties == {}
+        assert f1.types == [] and f1.types is not f2.types
+
+    def test_from_json_bytes(self, raw_lpf_bytes):
+        """Test creating a FeatureCollection straight from LPF JSON."""
+        fc = FeatureCollection.from_json_bytes(raw_lpf_bytes)
+        assert len(fc.features) == 1
+        assert fc.features[0].properties["title"] == "Rahat Salak"
+        assert fc.asdict() == FeatureCollection(**json.loads(raw_lpf_bytes)).asdict()
+
+    def test_from_trusted_dict(self):
+        """Test skipping property validation for trusted input."""
+        props = {"title": "Place 1", "ccodes": ["US"], "fclasses": ["Z"]}
+        d = {"features": [{"properties": props}]}
+        with raises(LPFValueError):
+            FeatureCollection(**d)
+        fc = FeatureCollection.from_trusted_dict(d)
+        assert fc.features[0].properties["fclasses"] == ["Z"]
+        fc = FeatureCollection.from_trusted_dict(
+            {"features": [{"properties": props}] * 2}
+        )
+        assert len(fc.features) == 2
+
+    def test_validate_key(self):
+        """Test that a "validate" member in LPF data is ignored like any other."""
+        props = {"title": "Place 1", "ccodes": ["US"], "fclasses": ["Z"]}
+        d = {"features": [{"properties": VALID_PROPS, "validate": False}]}
+        assert len(FeatureCollection(**d).features) == 1
+        assert len(FeatureCollection.from_trusted_dict(d).features) == 1
+        d = {"validate": "no", "features": [{"properties": props}]}
+        with raises(LPFValueError):
+            FeatureCollection(**d)
+        d = {"validate": True, "features": [{"properties": props}]}
+        assert len(FeatureCollection.from_trusted_dict(d).features) == 1
+
+    def test_build_shapes(self):
+        """Test building all shapely geometries in one call."""
+        props = VALID_PROPS
+        fc = FeatureCollection(
+            features=[
+                Feature(
+                    properties=props, geometry={"type": "Point", "coordinates": [1, 2]}
+                ),
+                Feature(properties=props),
+                Feature(
+                    properties=props,
+                    geometry={"type": "LineString", "coordinates": [[0, 0], [3, 4]]},
+                ),
+            ]
+        )
+        fc.build_shapes()
+        assert fc.features[0].geometry._shape is not None
+        point = fc.features[0].geometry.shape
+        assert (point.x, point.y) == (1.0, 2.0)
+        assert fc.features[2].geometry.shape.length == 5.0
+        fc = FeatureCollection(features=[Feature(geometry=Geometry(type="Point"))])
+        fc.build_shapes()
+        assert fc.features[0].geometry.shape.is_empty
+
 
 class TestFeatureType:
-    def test_fc_creation(self):
+    def test_fc_creation(self, sample_langstring):
         """Test creating a FeatureClass with citations and aliases."""
         cit = {
             "id": "cite-001",
@@ -112,7 +193,7 @@ class TestFeatureType:
             label_lang="en",
             aliases=[
                 {"text": "inhabited place", "lang": "en"},
-                LangString("asentamiento", "es"),
+                sample_langstring,
             ],
             citations=[cit],
         )
@@ -138,6 +219,108 @@ class TestFeatureType:
             ft.citations[0].citation_detail == "human settlement (Q486972)"
         )  # NB space normalized
 
+    def test_lang_tag_strings(self):
+        """Test "text@lang" strings for labels and aliases."""
+        ft = FeatureType(
+            id="settlement", label="Settlement@en", aliases=["asentamiento@es"]
+        )
+        assert ft.label.text == "settlement"
+        assert ft.label.lang == "en"
+        assert ft.aliases["es"] == {"asentamiento"}
+        ft.add_alias("Siedlung", "de")
+        assert ft.aliases["de"] == {"Siedlung"}
+        ft.add_alias("info@example.org")
+        assert ft.aliases["und"] == {"info@example.org"}
+
+    def test_langstring_flags(self):
+        """Test that LangString rules apply as soon as the module is imported."""
+        ls = LangString("Settlement", "EN")
+        assert ls.lang == "en"
+        ft = FeatureType(id="settlement", label=ls, label_lang="en")
+        assert ft.label.lang == "en"
+
+    def test_label(self):
+        """Test that labels from any source give the same LangString."""
+        for label in ("Settlement@en", {"text": " Settlement ", "lang": "en"}):
+            ft = FeatureType(id="settlement", label=label)
+            assert (ft.label.text, ft.label.lang) == ("settlement", "en")
+            assert ft.label is ft.label
+            assert ft.asdict()["label"] == "settlement"
+        with raises(LPFValueError):
+            FeatureType(id="settlement", label={"text": " ", "lang": "en"})
+        ft.label.text = "town"
+        assert ft.asdict()["label"] == "town"
+
+    def test_set_aliases(self):
+        """Test setting aliases from a dict or a MultiLangString."""
+        ft = FeatureType(id="settlement", label="settlement")
+        ft.set_aliases({"en": ["inhabited place"], "es": ["asentamiento"]})
+        assert ft.asdict()["aliases"] == [
+            {"label": "inhabited place", "lang": "en"},
+            {"label": "asentamiento", "lang": "es"},
+        ]
+        ft.set_aliases(MultiLangString({"de": {"Siedlung"}}))
+        assert ft.asdict()["aliases"] == [{"label": "Siedlung", "lang": "de"}]
+        with raises(LPFTypeError):
+            ft.set_aliases("Siedlung")
+
+    def test_variant_constructors(self):
+        """Test the per-variant FeatureType constructors."""
+        lpf = FeatureType.from_lpf_v1(
+            "Settlement", "aat:300008347", ["asentamiento@es"], label_lang="en"
+        )
+        whg = FeatureType.from_whg("settlement", "aat:300008347")
+        pleiades = FeatureType.from_pleiades(
+            "settlement", id="aat:300008347", aliases=["asentamiento@es"]
+        )
+        for ft in (lpf, whg, pleiades):
+            assert ft.id == "aat:300008347"
+            assert ft.label.text == "settlement"
+        assert (
+            lpf.asdict()
+            == FeatureType(
+                label="Settlement",
+                label_lang="en",
+                identifier="aat:300008347",
+                sourceLabels=["asentamiento@es"],
+            ).asdict()
+        )
+        assert pleiades.aliases["es"] == {"asentamiento"}
+        assert FeatureType.from_whg("human settlement").id == "human-settlement"
+        with raises(LPFValueError):
+            FeatureType.from_pleiades("")
+
+    def test_aliases_asdict(self):
+        """Test that aliases are deduplicated and serialized in order."""
+        ft = FeatureType(
+            id="settlement",
+            label="settlement",
+            aliases=["Siedlung@DE", "asentamiento@es", "Siedlung@de"],
+        )
+        assert ft.asdict()["aliases"] == [
+            {"label": "Siedlung", "lang": "de"},
+            {"label": "asentamiento", "lang": "es"},
+        ]
+        assert ft.aliases["de"] == {"Siedlung"}
+        with raises(ValueError):
+            ft.add_alias("Siedlung", "not a language")
+
+    def test_aliases_mutation(self):
+        """Test that changes made through the aliases MultiLangString are kept."""
+        ft = FeatureType(id="settlement", label="settlement", aliases=["Siedlung@de"])
+        ft.aliases.add_entry("ville", "fr")
+        ft.add_alias("Siedlung", "de")
+        ft.add_alias("asentamiento", "es")
+        assert sorted(ft.asdict()["aliases"], key=lambda a: a["lang"]) == [
+            {"label": "Siedlung", "lang": "de"},
+            {"label": "asentamiento", "lang": "es"},
+            {"label": "ville", "lang": "fr"},
+        ]
+        assert sorted(ft._alias_text_list()) == ["Siedlung", "asentamiento", "ville"]
+        ft.set_aliases(["Dorf@de"])
+        assert ft.aliases["de"] == {"Dorf"}
+        assert "fr" not in ft.aliases.mls_dict
+
 
 class TestGeometry:
     def test_geometry_creation(self):
@@ -146,3 +329,106 @@ class TestGeometry:
         assert geom.type == "Point"
         assert geom.coordinates == (102.0, 0.5)
         assert geom.asdict() == {"type": "Point", "coordinates": (102.0, 0.5)}
+
+    def test_geometry_shape(self):
+        """Test that the shapely geometry is built on demand."""
+        geom = Geometry(type="LineString", coordinates=[[0, 0], [3, 4]])
+        assert geom.coordinates == ((0.0, 0.0), (3.0, 4.0))
+        assert geom.shape.length == 5.0
+        assert geom.shape.__geo_interface__["coordinates"] == geom.coordinates
+
+    def test_geometry_from_geojson(self):
+        """Test creating a Geometry from a GeoJSON dictionary."""
+        geom = Geometry.from_geojson(
+            {"type": "Point", "coordinates": [102.0, 0.5], "certainty": "certain"}
+        )
+        assert geom.type == "Point"
+        assert geom.certainty == "certain"
+        assert geom.coordinates == (102.0, 0.5)
+
+    def test_geometry_from_shape(self):
+        """Test wrapping an existing shapely geometry."""
+        point = shapely.Point(102.0, 0.5)
+        geom = Geometry._from_shape(point)
+        assert geom.type == "Point"
+        assert geom.coordinates == (102.0, 0.5)
+        assert geom.shape is point
+
+    def test_geometry_certainty(self):
+        """Test that certainty is stored as a Certainty and serialized as text."""
+        geom = Geometry(type="Point", coordinates=[0.0, 0.0], certainty="uncertain")
+        assert geom.certainty is Certainty.UNCERTAIN
+        assert json.loads(json.dumps(geom.asdict()))["certainty"] == "uncertain"
+        with raises(LPFValueError):
+            geom.certainty = "probable"
+
+    def test_feature_geometry_from_shape(self):
+        """Test setting a Feature geometry from shapely and __geo_interface__."""
+        point = shapely.Point(102.0, 0.5)
+        f = Feature(geometry=point)
+        assert f.geometry.shape is point
+        assert f.geometry.asdict() == {"type": "Point", "coordinates": (102.0, 0.5)}
+
+        class GeoThing:
+            __geo_interface__ = {"type": "Point", "coordinates": (1.0, 2.0)}
+
+        f.geometry = GeoThing()
+        assert f.geometry.coordinates == (1.0, 2.0)
+        with raises(LPFTypeError):
+            f.geometry = "POINT (1 2)"
+        for geom in (
+            shapely.GeometryCollection([point]),
+            shapely.LinearRing([(0, 0), (1, 0), (1, 1)]),
+        ):
+            with raises(LPFValueError):
+                f.geometry = geom
+
+    def test_geometry_invalid_type(self):
+        """Test that an unknown geometry type raises an error."""
+        with raises(LPFValueError):
+            Geometry(type="Circle", coordinates=[0.0, 0.0])
+
+    @mark.parametrize(
+        "geom_type,coordinates",
+        [
+            ("Point", [1]),
+            ("Point", [1, 2, 3, 4]),
+            ("Point", "12"),
+            ("Point", ["1", "2"]),
+            ("Point", [[1, 2]]),
+            ("MultiPoint", [1, 2]),
+            ("LineString", [[0, 0]]),
+            ("MultiLineString", [[[0, 0], [1, 1]], [[0, 0]]]),
+            ("Polygon", [[[0, 0], [1, 0], [0, 0]]]),
+            ("Polygon", [[0, 0], [1, 0], [1, 1], [0, 0]]),
+            ("MultiPolygon", [[[[0, 0], [1, 0]]]]),
+            ("GeometryCollection", []),
+        ],
+        ids=[
+            "point_one_number",
+            "point_four_numbers",
+            "point_string",
+            "point_string_numbers",
+            "point_too_deep",
+            "multipoint_too_shallow",
+            "linestring_one_position",
+            "multilinestring_one_position",
+            "polygon_short_ring",
+            "polygon_too_shallow",
+            "multipolygon_short_ring",
+            "geometrycollection",
+        ],
+    )
+    def test_geometry_invalid_coordinates(self, geom_type, coordinates):
+        """Test that structurally invalid coordinates raise an error."""
+        with raises(LPFValueError):
+            Geometry(type=geom_type, coordinates=coordinates)
+
+    def test_geometry_polygon_closed(self):
+        """Test that unclosed polygon rings are closed, as shapely does."""
+        ring = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 0.0))
+        geom = Geometry(type="Polygon", coordinates=[[[0, 0], [1, 0], [1, 1]]])
+        assert geom.coordinates == (ring,)
+        geom = Geometry(type="MultiPolygon", coordinates=[[ring]])
+        assert geom.coordinates == ((ring,),)
+        assert Geometry(type="Point").coordinates == ()
@@ -0,0 +1,53 @@
+#
+# This file is part of pleiades_lpf
+# by Tom Elliott for the Institute for the Study of the Ancient World
+# (c) Copyright 2025 by New York University
+# Licensed under the AGPL-3.0; see LICENSE.txt file.
+#
+
+"""
+Test the identifiers module.
+"""
+
+import copy
+from pleiades_lpf.identifiers import Identifier, URLIdentifier, make_identifier
+from pytest import raises
+
+
+class TestIdentifier:
+    def test_make_identifier(self):
+        """Test sniffing the identifier type from the value."""
+        url = make_identifier("https://pleiades.stoa.org/places/579885")
+        assert isinstance(url, URLIdentifier)
+        assert url.id_type == "url"
+        assert make_identifier("aat:300008347").id_type == "alphanumeric-delimited"
+        assert make_identifier("settlement").id_type == "alphanumeric-delimited"
+
+    def test_invalid_values(self):
+        """Test that invalid identifier values raise errors."""
+        with raises(ValueError):
+            Identifier("alphanumeric", "not alphanumeric!")
+        with raises(ValueError):
+            URLIdentifier("pleiades.stoa.org/places/579885")
+        with raises(ValueError):
+            Identifier("doi", "10.1000/182")
+
+    def test_equality(self):
+        """Test that identifiers compare and hash by type and value."""
+        a = Identifier("alphanumeric", "abc123")
+        b = Identifier("alphanumeric", " abc123 ")
+        assert a == b
+        assert a != Identifier("alphanumeric-delimited", "abc123")
+        assert {a: 1}[b] == 1
+        assert str(a) == "abc123"
+
+    def test_immutable(self):
+        """Test that shared identifiers cannot be changed after creation."""
+        url = make_identifier("https://pleiades.stoa.org/places/579885")
+        assert make_identifier("https://pleiades.stoa.org/places/579885") is url
+        with raises(AttributeError):
+            url.id_value = "x"
+        with raises(AttributeError):
+            del url.id_type
+        assert url.id_value == "https://pleiades.stoa.org/places/579885"
+        assert copy.deepcopy(url) == url
@@ -9,14 +9,16 @@
 Test loading/dumping.
 """
 from copy import deepcopy
+import io
 import json
 import logging
 from pathlib import Path
-from pleiades_lpf import dump, dumps, load, loads
-from pleiades_lpf.gazetteer import FeatureCollection, FeatureType, Geometry
+from pleiades_lpf import dump, dumps, iter_features, load, load_stream, loads
+from pleiades_lpf.gazetteer import Feature, FeatureCollection, FeatureType, Geometry
 from pprint import pformat
-from pytest import raises
+from pytest import importorskip, mark, raises
 
+logger = logging.getLogger(__name__)
 test_data_dir = Path(__file__).parent / "data"
 
 
@@ -27,8 +29,6 @@ class TestModule:
         filepath = test_data_dir / filename
         with open(filepath, "r", encoding="utf-8") as f:
             fc = load(f)
-        del f
-        assert isinstance(fc, FeatureCollection)
         assert isinstance(fc, FeatureCollection)
         assert len(fc.features) == 1
 
@@ -47,25 +47,149 @@ class TestModule:
         assert isinstance(f.geometry, Geometry)
         assert f.geometry.type == "Point"
         assert f.geometry.coordinates == (18.1333333, 14.2333333)
-        import logging
-        from pprint import pformat
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", pformat(fc.asdict(), indent=2))
+
+    def test_load_partly_read(self, raw_lpf_bytes, tmp_path):
+        """Test loading from a text file that has already been read from."""
+        filepath = tmp_path / "prefixed.json"
+        filepath.write_bytes(b"LPF:" + raw_lpf_bytes)
+        with open(filepath, "r", encoding="utf-8") as f:
+            assert f.read(4) == "LPF:"
+            fc = load(f)
+        assert fc.features[0].properties["title"] == "Rahat Salak"
+
+    def test_loads(self, raw_lpf_bytes):
+        """Test loading LPF from a string."""
+        fc = loads(raw_lpf_bytes.decode("utf-8"))
+        assert isinstance(fc, FeatureCollection)
+        assert len(fc.features) == 1
+        assert fc.features[0].properties["title"] == "Rahat Salak"
+
+    def test_load_stream(self):
+        """Test loading LPF from a file one feature at a time."""
+        importorskip("ijson")
+        filepath = test_data_dir / "whg_7637009.json"
+        with open(filepath, "rb") as f:
+            fc = load_stream(f)
+        assert isinstance(fc, FeatureCollection)
+        assert len(fc.features) == 1
+        assert fc.features[0].properties["title"] == "Rahat Salak"
+        assert fc.features[0].geometry.coordinates == (18.1333333, 14.2333333)
 
-        logger = logging.getLogger(__name__)
-        logger.debug(pformat(fc.asdict(), indent=2))
+    def test_iter_features(self):
+        """Test iterating over the Features in a file without loading them all."""
+        importorskip("ijson")
+        filepath = test_data_dir / "whg_7637009.json"
+        with open(filepath, "r", encoding="utf-8") as f:
+            features = list(iter_features(f))
+        assert len(features) == 1
+        assert isinstance(features[0], Feature)
+        assert features[0].properties["title"] == "Rahat Salak"
+
+    @mark.filterwarnings("error::DeprecationWarning")
+    def test_iter_features_text(self, raw_lpf_bytes):
+        """Test streaming LPF from text that is not a UTF-8 file buffer."""
+        importorskip("ijson")
+        text = raw_lpf_bytes.decode("utf-8")
+        features = list(iter_features(io.StringIO(text)))
+        assert features[0].properties["title"] == "Rahat Salak"
+        fc = load_stream(io.StringIO(text))
+        assert fc.asdict() == loads(raw_lpf_bytes).asdict()
+
+    def test_dumps(self):
+        """Test serializing LPF to a JSON string."""
+        d = {"type": "FeatureCollection", "features": [], "title": "Ἀθῆναι"}
+        assert json.loads(dumps(d)) == d
+        assert json.loads(dumps(d, indent=2, sort_keys=True)) == d
+
+    @mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"ensure_ascii": True},
+            {"ensure_ascii": False},
+            {"ensure_ascii": False, "separators": (",", ":")},
+            {"indent": 4},
+            {"indent": 0},
+            {"indent": 2},
+            {"indent": 2, "ensure_ascii": False},
+            {"indent": 2, "ensure_ascii": False, "sort_keys": True},
+        ],
+        ids=[
+            "default",
+            "ensure_ascii",
+            "ensure_ascii_false",
+            "compact",
+            "indent_4",
+            "indent_0",
+            "indent_2_ascii",
+            "indent_2",
+            "sort_keys",
+        ],
+    )
+    def test_dumps_kwargs(self, kwargs):
+        """Test that json keyword arguments give the same text as json."""
+        d = {"type": "FeatureCollection", "title": "Ἀθῆναι", "features": [{"a": 1}]}
+        assert dumps(d, **kwargs) == json.dumps(d, **kwargs)
+        text = io.StringIO()
+        dump(d, text, **kwargs)
+        assert text.getvalue() == json.dumps(d, **kwargs)
+
+    def test_dumps_lpf_objects(self):
+        """Test serializing LPF objects nested in other data."""
+        f = Feature(
+            properties={"title": "Ἀθῆναι", "ccodes": ["GR"], "fclasses": ["P"]},
+            geometry={"type": "Point", "coordinates": [23.7, 37.9]},
+        )
+        d = json.loads(dumps({"features": [f]}))
+        assert d == json.loads(json.dumps({"features": [f.asdict()]}))
+        assert json.loads(dumps(f.geometry)) == {
+            "type": "Point",
+            "coordinates": [23.7, 37.9],
+        }
+        with raises(TypeError):
+            dumps({"x": object()})
+
+    def test_dump(self):
+        """Test serializing LPF to text and binary file-like objects."""
+        d = {"type": "FeatureCollection", "features": [], "title": "Ἀθῆναι"}
+        text = io.StringIO()
+        dump(d, text)
+        assert json.loads(text.getvalue()) == d
+        binary = io.BytesIO()
+        dump(d, binary)
+        assert json.loads(binary.getvalue().decode("utf-8")) == d
+
+    def test_dump_feature_collection(self, lpf_fc):
+        """Test serializing a FeatureCollection one feature at a time."""
+        fc = lpf_fc
+        expected = json.loads(json.dumps(fc.asdict()))
+        assert json.loads(dumps(fc)) == expected
+        assert json.loads("".join(fc.iterencode())) == expected
+        text = io.StringIO()
+        dump(fc, text)
+        assert json.loads(text.getvalue()) == expected
+        binary = io.BytesIO()
+        dump(fc, binary)
+        assert json.loads(binary.getvalue()) == expected
+        text = io.StringIO()
+        dump(fc, text, indent=2)
+        assert json.loads(text.getvalue()) == expected
+        for kwargs in ({}, {"sort_keys": True}, {"separators": (",", ":")}):
+            text = io.StringIO()
+            dump(fc, text, **kwargs)
+            assert text.getvalue() == dumps(fc.asdict(), **kwargs)
 
 
 class TestAugment:
-    def test_augment_fc(self):
+    def test_augment_fc(self, lpf_fc):
         """Test augmenting FeatureCollection."""
-        filename = "whg_7637009.json"
-        filepath = test_data_dir / filename
-        with open(filepath, "r", encoding="utf-8") as f:
-            fcoll = load(f)
-        del f
+        fcoll = lpf_fc
         assert len(fcoll.features[0].types[0].citations) == 0
         fcoll.augment()
         assert len(fcoll.features[0].types[0].citations) == 1
         c = fcoll.features[0].types[0].citations[0]
         assert c.short_title == "Getty AAT"
-        logger = logging.getLogger(__name__)
-        logger.debug(pformat(fcoll.asdict(), indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", pformat(fcoll.asdict(), indent=2))